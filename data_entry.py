@@ -1,8 +1,8 @@
-"""Modern sales data entry application with Excel persistence and reporting hooks.
+"""Modern sales data entry application with Parquet/Excel persistence and reporting hooks.
 
 This module implements the user-facing GUI described in the specification.  It
 provides a Tkinter based user interface with modern styling, input
-validation, Excel synchronisation and integration with the ``sales_reporting``
+validation, data file synchronisation and integration with the ``sales_reporting``
 module.  The goal of the implementation is to provide a pleasant and reliable
 experience for day-to-day sales data management.
 """
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
 import threading
+import time
 import tkinter as tk
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
@@ -18,8 +20,9 @@ from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from functools import partial
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog, ttk
-from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from tkcalendar import DateEntry
 
@@ -32,6 +35,16 @@ except ImportError:  # pragma: no cover - runtime guard
     FigureCanvasTkAgg = None  # type: ignore[assignment]
     Figure = None  # type: ignore[assignment]
 
+try:  # Optional dependency for the Parquet master file
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - runtime guard
+    pyarrow = None  # type: ignore[assignment]
+
+try:  # Optional dependency for faster Excel writes
+    import xlsxwriter  # noqa: F401
+except ImportError:  # pragma: no cover - runtime guard
+    xlsxwriter = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as FigureCanvasTkAggType
 else:  # pragma: no cover - runtime fallback
@@ -40,12 +53,14 @@ else:  # pragma: no cover - runtime fallback
 
 APP_TITLE = "Satış Veri Giriş Sistemi"
 APP_GEOMETRY = "1200x820"
-DATA_FILE = "sales_data_master.xlsx"
+LEGACY_DATA_FILE = "sales_data_master.xlsx"
+DATA_FILE = "sales_data_master.parquet" if pyarrow is not None else LEGACY_DATA_FILE
 CONFIG_FILE = "config.json"
 BACKUP_DIR = Path("backups")
 REPORT_DIR = Path("reports")
 AUTO_SAVE_INTERVAL = 5 * 60 * 1000  # 5 minutes in milliseconds
 PAGE_SIZE = 15
+PROGRESS_UPDATE_INTERVAL = 1 / 30  # seconds between report progress redraws
 FORM_BUTTON_WIDTH = 12
 
 ASSETS_DIR = Path("assets")
@@ -72,6 +87,16 @@ COLUMNS = [
     "Invoiced",
     "Invoiced Amount",
 ]
+INVOICED_IDX = COLUMNS.index("Invoiced")
+
+# Shared Treeview tag tuples for table rows
+TAGS_INVOICED = ("invoiced",)
+TAGS_EVEN = ("even",)
+TAGS_ODD = ("odd",)
+
+# Plain numeric cells: thousands separators above 999, two decimals throughout
+FMT_BIG = "{:,.2f}".format
+FMT_SMALL = "{:.2f}".format
 
 DEFAULT_SALES_REPS = ["Fatih Aykut", "Ridvan Yasar", "Rami Sakin"]
 OTHER_SALES_REP_OPTION = "Diğer..."
@@ -108,6 +133,128 @@ FLOAT_FIELDS = {"Amount", "Total Discount", "CPI", "CPS", "Invoiced Amount"}
 
 CURRENCY_FIELDS = {"Amount", "CPS", "CPI", "Invoiced Amount"}
 
+# Turkish-style number input: drop currency/percent signs, spaces and thousands
+# dots, then turn the decimal comma into a dot
+NUMBER_INPUT_TRANSLATION = str.maketrans({"€": None, " ": None, "%": None, ".": None, ",": "."})
+
+# Text date layouts tried in order before a day-first guess
+DATE_TEXT_FORMATS = ("%d.%m.%Y", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S")
+
+# Repetitive columns stored as pandas categoricals; string methods and equality
+# checks on them run once per distinct value instead of once per row
+CATEGORICAL_FIELDS = ("Customer Name", "Sales Man", "QI Forecast", "Invoiced")
+
+
+def _write_excel(df: pd.DataFrame, path) -> None:
+    """Write ``df`` as a single sheet, preferring xlsxwriter over openpyxl."""
+
+    if xlsxwriter is None:
+        df.to_excel(path, index=False)
+        return
+    df.to_excel(
+        path,
+        index=False,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"strings_to_formulas": False, "strings_to_urls": False}},
+    )
+
+
+def _stream_excel(df: pd.DataFrame, path) -> None:
+    """Write ``df`` row by row in xlsxwriter's constant-memory mode.
+
+    Used for backups, where a large frame should not be mirrored by a full
+    in-memory workbook. Falls back to :func:`_write_excel` without xlsxwriter.
+    """
+
+    if xlsxwriter is None:
+        _write_excel(df, path)
+        return
+    # xlsxwriter rejects NaN and NaT; blank cells are written as None instead
+    columns = [
+        series.astype(object).where(series.notna(), None).tolist() for _, series in df.items()
+    ]
+    workbook = xlsxwriter.Workbook(
+        str(path),
+        {
+            "constant_memory": True,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        },
+    )
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, [str(column) for column in df.columns])
+        for row_number, row in enumerate(zip(*columns), start=1):
+            worksheet.write_row(row_number, 0, row)
+    finally:
+        workbook.close()
+
+
+def _is_parquet_path(path: object) -> bool:
+    return str(path).lower().endswith(".parquet")
+
+
+def _parse_date_column(series: pd.Series) -> pd.Series:
+    """Column-wise ``_parse_date_str``: datetimes pass through, text tries the
+    stored formats before falling back to a day-first guess."""
+
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series
+    is_text = series.map(lambda value: isinstance(value, str)).astype(bool)
+    result = pd.to_datetime(series.where(~is_text), errors="coerce")
+    pending = series[is_text].astype(str)
+    pending = pending[pending != ""]
+    for fmt in DATE_TEXT_FORMATS:
+        if pending.empty:
+            break
+        parsed = pd.to_datetime(pending, format=fmt, errors="coerce")
+        matched = parsed.notna()
+        result.loc[parsed.index[matched]] = parsed[matched]
+        pending = pending[~matched]
+    if not pending.empty:
+        result.loc[pending.index] = pd.to_datetime(pending, format="mixed", dayfirst=True, errors="coerce")
+    return result
+
+
+def _value_fits_dtype(value: object, dtype) -> bool:
+    """Whether ``value`` can be stored in a non-object column of ``dtype`` as is."""
+
+    if pd.api.types.is_string_dtype(dtype):
+        return isinstance(value, str)
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return isinstance(value, (datetime, date, np.datetime64))
+    if pd.api.types.is_bool_dtype(dtype):
+        return isinstance(value, (bool, np.bool_))
+    if pd.api.types.is_numeric_dtype(dtype):
+        return isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+    return False
+
+
+def _prepare_for_parquet(df: pd.DataFrame) -> pd.DataFrame:
+    """Narrow object columns to a single type so they can be stored as Parquet."""
+
+    converted: Dict[str, pd.Series] = {}
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Stored as plain values; the app re-encodes categoricals on load
+            series = series.astype(object)
+        elif series.dtype != object:
+            continue
+        # Blank form fields are saved as ""; they must not turn a date or
+        # number column into "mixed" text, and the conversions below map them
+        # to NaT/NaN
+        kind = pd.api.types.infer_dtype(series[series.ne("")], skipna=True)
+        if kind in ("floating", "integer", "mixed-integer-float", "decimal"):
+            series = pd.to_numeric(series, errors="coerce")
+        elif kind == "datetime":
+            series = pd.to_datetime(series, errors="coerce")
+        elif kind not in ("string", "empty", "boolean", "date"):
+            series = series.where(series.isna(), series.astype(str))
+        converted[column] = series
+    return df.assign(**converted) if converted else df
+
 
 @dataclass
 class FilterOptions:
@@ -135,6 +282,18 @@ class SalesEntryApp:
         self.history: List[pd.DataFrame] = []
         self.redo_stack: List[pd.DataFrame] = []
         self.filter_options = FilterOptions()
+        self._sort_column: Optional[str] = None
+        self._sort_ascending = True
+        self._tree_configured = False
+        self._filtered_cache: Optional[pd.DataFrame] = None
+        self._view_cache: Optional[pd.DataFrame] = None
+        self._issue_dates: Optional[pd.Series] = None
+        self._page_iids: List[str] = []
+        # self.df label of the record behind each row in _page_iids
+        self._page_labels: List[int] = []
+        self._row_cache: Dict[str, Tuple[Tuple[object, ...], Tuple[str, ...]]] = {}
+        self._excel_file: Optional[pd.ExcelFile] = None
+        self._excel_file_key: Optional[Tuple[str, float]] = None
         self._updating_cpi_field = False
         self._suspend_delivery_autofill = False
         self._theme_settings: Dict[str, str] = {}
@@ -156,7 +315,7 @@ class SalesEntryApp:
         self._apply_theme(self._config.get("theme", DEFAULT_THEME))
 
         self._ensure_directories()
-        self._ensure_excel_file()
+        self._ensure_data_file()
 
         self._create_styles()
         self._create_status_bar()
@@ -169,6 +328,7 @@ class SalesEntryApp:
 
         self.load_data()
         self.schedule_auto_backup()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ------------------------------------------------------------------ setup
     def _load_config(self) -> Dict[str, object]:
@@ -497,11 +657,15 @@ class SalesEntryApp:
         BACKUP_DIR.mkdir(exist_ok=True)
         REPORT_DIR.mkdir(exist_ok=True)
 
-    def _ensure_excel_file(self) -> None:
+    def _ensure_data_file(self) -> None:
         if os.path.exists(DATA_FILE):
             return
-        df = pd.DataFrame(columns=COLUMNS)
-        df.to_excel(DATA_FILE, index=False)
+        if _is_parquet_path(DATA_FILE) and os.path.exists(LEGACY_DATA_FILE):
+            # One-shot migration of the Excel master used by earlier versions
+            df = pd.read_excel(LEGACY_DATA_FILE)
+        else:
+            df = pd.DataFrame(columns=COLUMNS)
+        self._write_data_file(df, DATA_FILE)
 
     def _create_styles(self) -> None:
         # Additional style customisation for treeview
@@ -530,7 +694,7 @@ class SalesEntryApp:
         file_menu.add_command(label="Kaydet", command=self.save_current_dataframe)
         file_menu.add_command(label="Farklı Kaydet", command=self.save_as)
         file_menu.add_separator()
-        file_menu.add_command(label="Çıkış", accelerator="Ctrl+Q", command=self.root.quit)
+        file_menu.add_command(label="Çıkış", accelerator="Ctrl+Q", command=self._on_close)
         menubar.add_cascade(label="Dosya", menu=file_menu)
 
         edit_menu = tk.Menu(menubar, tearoff=0)
@@ -575,8 +739,8 @@ class SalesEntryApp:
         self.root.bind("<Control-Y>", lambda event: self.redo_last_change())
         self.root.bind("<Control-f>", lambda event: self.open_filter_window())
         self.root.bind("<Control-F>", lambda event: self.open_filter_window())
-        self.root.bind("<Control-q>", lambda event: self.root.quit())
-        self.root.bind("<Control-Q>", lambda event: self.root.quit())
+        self.root.bind("<Control-q>", lambda event: self._on_close())
+        self.root.bind("<Control-Q>", lambda event: self._on_close())
         self.root.bind("<F5>", lambda event: self.load_data())
 
     def _create_main_frames(self) -> None:
@@ -781,8 +945,12 @@ class SalesEntryApp:
 
         self.discount_entry.bind("<FocusIn>", self._on_discount_focus_in)
         self.discount_entry.bind("<FocusOut>", self._format_discount_entry)
-        self.form_vars["Amount"].trace_add("write", lambda *args: self._update_cpi_field())
-        self.form_vars["CPS"].trace_add("write", lambda *args: self._update_cpi_field())
+        # A single key validator on both entries keeps CPI in sync; programmatic
+        # updates of these fields call _update_cpi_field explicitly.
+        self._cpi_source_fields = {str(self.amount_entry): "Amount", str(self.cps_entry): "CPS"}
+        numeric_vcmd = (self.root.register(self._on_numeric_keypress), "%P", "%W")
+        for entry in (self.amount_entry, self.cps_entry):
+            entry.configure(validate="key", validatecommand=numeric_vcmd)
         self._update_cpi_field()
 
         # Boolean seçenekler
@@ -876,19 +1044,7 @@ class SalesEntryApp:
             style="Custom.Treeview",
         )
         self.tree.pack(side="left", fill="both", expand=True)
-
-        display_names = {
-            "Invoiced Amount": "CPI Tutarı",
-            "Delivery Note": "Notlar",
-            "Sales Ticket Reference": "SalesForce Ref",
-        }
-        for col in columns:
-            heading_text = display_names.get(col, col)
-            self.tree.heading(col, text=heading_text, command=partial(self.sort_by_column, col))
-            self.tree.column(col, width=120, anchor="center")
-        self.tree.column("#", width=60, anchor="center")
-        self.tree.column("Definition", width=200, anchor="w")
-        self.tree.column("Delivery Note", width=220, anchor="w")
+        self._configure_tree_columns()
 
         scrollbar_y = ttk.Scrollbar(tree_container, orient="vertical", command=self.tree.yview)
         scrollbar_y.pack(side="right", fill="y")
@@ -910,6 +1066,24 @@ class SalesEntryApp:
         ttk.Label(pagination_frame, textvariable=self.page_var).pack(side="left", padx=8)
         ttk.Button(pagination_frame, text="Sonraki ▶", command=self.next_page).pack(side="left")
 
+    def _configure_tree_columns(self) -> None:
+        # Headings and widths never change at runtime; configure them once.
+        if self._tree_configured:
+            return
+        display_names = {
+            "Invoiced Amount": "CPI Tutarı",
+            "Delivery Note": "Notlar",
+            "Sales Ticket Reference": "SalesForce Ref",
+        }
+        for col in ["#", *COLUMNS]:
+            heading_text = display_names.get(col, col)
+            self.tree.heading(col, text=heading_text, command=partial(self.sort_by_column, col))
+            self.tree.column(col, width=120, anchor="center")
+        self.tree.column("#", width=60, anchor="center")
+        self.tree.column("Definition", width=200, anchor="w")
+        self.tree.column("Delivery Note", width=220, anchor="w")
+        self._tree_configured = True
+
     def _create_action_buttons(self) -> None:
         top_buttons = ttk.Frame(self.header_frame)
         top_buttons.pack(side="right", padx=(0, 12))
@@ -1173,8 +1347,7 @@ class SalesEntryApp:
 
         listbox = tk.Listbox(window, height=12, selectmode="extended")
         listbox.pack(fill="both", expand=True, padx=16)
-        for rep in self.sales_reps:
-            listbox.insert("end", rep)
+        listbox.insert("end", *self.sales_reps)
 
         entry_frame = ttk.Frame(window)
         entry_frame.pack(fill="x", padx=16, pady=8)
@@ -1287,7 +1460,7 @@ class SalesEntryApp:
             )
 
         def save_and_close() -> None:
-            raw_reps = [listbox.get(i) for i in range(listbox.size())]
+            raw_reps = list(listbox.get(0, "end"))
             unique_reps: List[str] = []
             for rep in raw_reps:
                 cleaned = rep.strip()
@@ -1302,6 +1475,7 @@ class SalesEntryApp:
                 self.form_vars["Sales Man"].set(options[0] if options else "")
             if self.filter_options.salesman and self.filter_options.salesman not in self.sales_reps:
                 self.filter_options.salesman = ""
+                self._invalidate_filter_cache()
             window.destroy()
 
         def cancel() -> None:
@@ -1330,12 +1504,36 @@ class SalesEntryApp:
         menu.tk_popup(event.x_root, event.y_root)
 
     # ----------------------------------------------------------------- data i/o
+    def _read_data_file(self) -> pd.DataFrame:
+        if _is_parquet_path(DATA_FILE):
+            return pd.read_parquet(DATA_FILE)
+        # Keep the parsed workbook handle while the file is untouched so repeated
+        # refreshes skip re-opening the zip container.
+        key = (DATA_FILE, os.path.getmtime(DATA_FILE))
+        if self._excel_file is None or self._excel_file_key != key:
+            self._close_excel_file()
+            self._excel_file = pd.ExcelFile(DATA_FILE, engine="openpyxl")
+            self._excel_file_key = key
+        return self._excel_file.parse(self._excel_file.sheet_names[0])
+
+    def _write_data_file(self, df: pd.DataFrame, path: str) -> None:
+        if _is_parquet_path(path):
+            _prepare_for_parquet(df).to_parquet(path, compression="zstd", index=False)
+        else:
+            _write_excel(df, path)
+
+    def _close_excel_file(self) -> None:
+        if self._excel_file is not None:
+            self._excel_file.close()
+        self._excel_file = None
+        self._excel_file_key = None
+
     def load_data(self) -> None:
         try:
-            self.df = pd.read_excel(DATA_FILE)
+            self.df = self._read_data_file()
         except FileNotFoundError:
-            self._ensure_excel_file()
-            self.df = pd.read_excel(DATA_FILE)
+            self._ensure_data_file()
+            self.df = self._read_data_file()
         except Exception as exc:
             messagebox.showerror("Hata", f"Veri yüklenemedi: {exc}")
             return
@@ -1348,41 +1546,98 @@ class SalesEntryApp:
         if extra_columns:
             self.df = self.df.drop(columns=extra_columns)
         self.df = self.df[COLUMNS]
+        self._coerce_float_columns()
         self._normalise_discount_values()
+        self._normalise_invoiced_flags()
+        self._encode_categorical_columns()
+        self._issue_dates = None
         self._clear_history()
         self.apply_filters()
         self._update_status("Veri yüklendi")
 
     def save_current_dataframe(self) -> None:
+        # Every edit of self.df is persisted through here, so derived columns go stale
+        self._issue_dates = None
+        # An open read handle would block overwriting the workbook on Windows
+        self._close_excel_file()
         try:
-            self.df.to_excel(DATA_FILE, index=False)
+            self._write_data_file(self.df, DATA_FILE)
             self._update_status("Dosya kaydedildi")
         except Exception as exc:
             messagebox.showerror("Kaydetme Hatası", str(exc))
 
+    def _coerce_float_columns(self) -> None:
+        for column in FLOAT_FIELDS:
+            raw = self.df[column]
+            numeric = pd.to_numeric(raw, errors="coerce")
+            # Formatted legacy values such as "1.234,56 €" need the locale aware parser
+            leftover = numeric.isna() & raw.notna()
+            if leftover.any():
+                numeric = numeric.astype(float)
+                numeric[leftover] = raw[leftover].map(self._to_float).astype(float)
+            self.df[column] = numeric.astype(float)
+
     def _normalise_discount_values(self) -> None:
         if "Total Discount" not in self.df.columns:
             return
-        updated = False
-        for idx, row in self.df.iterrows():
-            discount_raw = self._to_float(row.get("Total Discount"))
-
-            if discount_raw is not None:
-                if discount_raw > 1:
-                    amount = self._to_float(row.get("Amount"))
-                    if amount:
-                        fraction = discount_raw / amount
-                    else:
-                        fraction = discount_raw / 100
-                else:
-                    fraction = discount_raw
-                fraction = max(0.0, min(fraction, 1.0))
-                if discount_raw != fraction:
-                    self.df.at[idx, "Total Discount"] = fraction
-                    updated = True
-        if updated:
+        discount = self.df["Total Discount"]
+        amount = self.df["Amount"]
+        has_amount = amount.notna() & (amount != 0)
+        scaled = (discount / amount).where(has_amount, discount / 100)
+        fraction = discount.where(discount <= 1, scaled).clip(lower=0.0, upper=1.0)
+        changed = discount.notna() & (fraction != discount)
+        if changed.any():
+            self.df.loc[changed, "Total Discount"] = fraction[changed]
             self._update_status("İndirim verileri güncellendi")
 
+    def _normalise_invoiced_flags(self) -> None:
+        # New records are saved upper-case; fold older rows too so readers can compare directly
+        self.df["Invoiced"] = self.df["Invoiced"].map(
+            lambda value: value.upper() if isinstance(value, str) else value
+        )
+
+    def _encode_categorical_columns(self) -> None:
+        for column in CATEGORICAL_FIELDS:
+            if not isinstance(self.df[column].dtype, pd.CategoricalDtype):
+                self.df[column] = self.df[column].astype("category")
+
+    def _prepare_record_for_frame(self, record: pd.Series) -> pd.Series:
+        """Fit the form's text values to the dtypes of the existing columns."""
+
+        prepared = record.copy()
+        for column, value in record.items():
+            dtype = self.df[column].dtype
+            if dtype == object or isinstance(dtype, pd.CategoricalDtype):
+                continue
+            if isinstance(value, str) and not value:
+                prepared[column] = None
+            elif not pd.isna(value) and not _value_fits_dtype(value, dtype):
+                # e.g. text in a column read back from blanks as numeric, or a
+                # datetime in a date column a legacy master stored as text
+                self.df[column] = self.df[column].astype(object)
+        return prepared
+
+    def _append_record(self, record: pd.Series) -> None:
+        """Add ``record`` as the new last row of ``self.df``."""
+
+        # Enlarging in place keeps the column dtypes; concat with the transposed
+        # record rebuilt every block and turned the numeric columns into objects.
+        record = self._prepare_record_for_frame(record)
+        self._add_missing_categories(record)
+        self.df.loc[len(self.df), record.index] = record.values
+
+    def _add_missing_categories(self, record: pd.Series) -> None:
+        # Categoricals reject unknown values on assignment; register them first
+        # while keeping the categories sorted so column sorting stays alphabetical.
+        for column in CATEGORICAL_FIELDS:
+            series = self.df[column]
+            value = record.get(column)
+            if not isinstance(series.dtype, pd.CategoricalDtype) or pd.isna(value):
+                continue
+            if value not in series.cat.categories:
+                categories = sorted([*series.cat.categories, value], key=str)
+                self.df[column] = series.cat.set_categories(categories)
+
     def save_as(self) -> None:
         filename = filedialog.asksaveasfilename(
             title="Farklı Kaydet",
@@ -1392,7 +1647,7 @@ class SalesEntryApp:
         if not filename:
             return
         try:
-            self.df.to_excel(filename, index=False)
+            _write_excel(self.df, filename)
             self._update_status(f"Dosya kaydedildi: {filename}")
         except Exception as exc:
             messagebox.showerror("Hata", str(exc))
@@ -1404,7 +1659,10 @@ class SalesEntryApp:
             self.load_data()
 
     def open_existing_file(self) -> None:
-        filename = filedialog.askopenfilename(title="Excel Dosyası", filetypes=[("Excel", "*.xlsx")])
+        filename = filedialog.askopenfilename(
+            title="Veri Dosyası",
+            filetypes=[("Veri Dosyası", "*.parquet *.xlsx"), ("Parquet", "*.parquet"), ("Excel", "*.xlsx")],
+        )
         if not filename:
             return
         global DATA_FILE
@@ -1413,7 +1671,19 @@ class SalesEntryApp:
         self.load_data()
 
     def open_backup_directory(self) -> None:
-        os.startfile(BACKUP_DIR) if os.name == "nt" else os.system(f"xdg-open '{BACKUP_DIR}'")
+        backup_path = BACKUP_DIR.resolve()
+        try:
+            if os.name == "nt":
+                os.startfile(backup_path)
+            else:
+                subprocess.Popen(
+                    ["xdg-open", str(backup_path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                )
+        except OSError as exc:
+            messagebox.showerror("Hata", f"Yedekleme klasörü açılamadı: {exc}")
 
     def export_filtered_data(self) -> None:
         filename = filedialog.asksaveasfilename(
@@ -1425,7 +1695,7 @@ class SalesEntryApp:
             return
         try:
             filtered_df = self.get_filtered_dataframe()
-            filtered_df.to_excel(filename, index=False)
+            _write_excel(filtered_df, filename)
             self._update_status(f"Dışa aktarıldı: {filename}")
         except Exception as exc:
             messagebox.showerror("Dışa Aktarım Hatası", str(exc))
@@ -1440,21 +1710,25 @@ class SalesEntryApp:
             return
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = BACKUP_DIR / f"backup_{timestamp}.xlsx"
-        try:
-            self.df.to_excel(backup_path, index=False)
-            self._update_status(f"Yedek oluşturuldu: {backup_path.name}")
-        except Exception as exc:
-            messagebox.showwarning("Yedekleme Hatası", str(exc))
-        finally:
-            self.schedule_auto_backup()
+        # Edits modify self.df in place, so the worker gets its own copy
+        snapshot = self.df.copy()
+        self.schedule_auto_backup()
+
+        def worker() -> None:
+            try:
+                _stream_excel(snapshot, backup_path)
+            except Exception as exc:
+                self.root.after(0, partial(messagebox.showwarning, "Yedekleme Hatası", str(exc)))
+            else:
+                self.root.after(0, partial(self._update_status, f"Yedek oluşturuldu: {backup_path.name}"))
+
+        threading.Thread(target=worker, daemon=True).start()
 
     # --------------------------------------------------------------- table ops
     def update_table(self, dataframe: Optional[pd.DataFrame] = None) -> None:
         df = dataframe if dataframe is not None else self.df
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
         if df.empty:
+            self._sync_tree_rows([], [])
             self.page_var.set("Sayfa 1/1")
             self.file_info_var.set(f"Dosya: {DATA_FILE} | Kayıt: 0")
             return
@@ -1467,59 +1741,207 @@ class SalesEntryApp:
 
         self._update_tree_tag_styles()
 
-        for idx, (_, row) in enumerate(page_df.iterrows(), start=start + 1):
-            formatted_values: List[str] = []
-            for col in COLUMNS:
-                if col == "Total Discount":
-                    formatted_values.append(self._format_discount_fraction(row[col]))
-                elif col in CURRENCY_FIELDS:
-                    formatted_values.append(self._format_currency(row[col]))
-                else:
-                    formatted_values.append(self._format_value(row[col]))
-            values = [idx] + formatted_values
-            is_invoiced = str(row.get("Invoiced", "")).upper() == "YES"
-            row_tags: List[str] = ["invoiced" if is_invoiced else ("even" if idx % 2 == 0 else "odd")]
-            self.tree.insert("", "end", values=values, tags=tuple(row_tags))
+        rows = self._format_page_rows(page_df)
+        entries: List[Tuple[Tuple[object, ...], Tuple[str, ...]]] = []
+        for idx, row in enumerate(rows, start=start + 1):
+            # The formatted cell is the stored flag, already upper-cased on load
+            if row[INVOICED_IDX] == "YES":
+                tags = TAGS_INVOICED
+            else:
+                tags = TAGS_EVEN if idx % 2 == 0 else TAGS_ODD
+            entries.append(((idx, *row), tags))
+        self._sync_tree_rows(entries, page_df.index.tolist())
 
         self.page_var.set(f"Sayfa {self.current_page}/{self.total_pages}")
         self.file_info_var.set(f"Dosya: {DATA_FILE} | Kayıt: {len(self.df)}")
 
+    def _sync_tree_rows(
+        self, entries: List[Tuple[Tuple[object, ...], Tuple[str, ...]]], labels: List[int]
+    ) -> None:
+        """Reuse the existing table rows, touching only the ones whose content changed.
+
+        ``labels`` holds the ``self.df`` label of each entry's record; the "#"
+        column only numbers the filtered and sorted view.
+        """
+
+        self._page_labels = labels
+
+        changed: List[str] = []
+        for position, entry in enumerate(entries):
+            values, tags = entry
+            if position < len(self._page_iids):
+                iid = self._page_iids[position]
+                if self._row_cache.get(iid) == entry:
+                    continue
+                self.tree.item(iid, values=values, tags=tags)
+                changed.append(iid)
+            else:
+                iid = self.tree.insert("", "end", values=values, tags=tags)
+                self._page_iids.append(iid)
+            self._row_cache[iid] = entry
+
+        surplus = self._page_iids[len(entries):]
+        if surplus:
+            self.tree.delete(*surplus)
+            for iid in surplus:
+                self._row_cache.pop(iid, None)
+            del self._page_iids[len(entries):]
+
+        # A reused row now shows a different record, so it must not stay selected
+        selected = set(self.tree.selection())
+        stale = [iid for iid in changed if iid in selected]
+        if stale:
+            self.tree.selection_remove(stale)
+
+    def _frame_label(self, iid: str) -> Optional[int]:
+        """Return the ``self.df`` label of the record shown in table row ``iid``."""
+
+        try:
+            return self._page_labels[self._page_iids.index(iid)]
+        except (ValueError, IndexError):
+            return None
+
+    def _format_page_rows(self, page_df: pd.DataFrame) -> List[Tuple[str, ...]]:
+        """Format the page column by column and return one tuple per table row."""
+
+        formatted_columns = [
+            self._pick_column_formatter(col, page_df[col].dtype)(page_df[col]) for col in COLUMNS
+        ]
+        return list(zip(*formatted_columns))
+
+    def _pick_column_formatter(self, column: str, dtype) -> Callable[[pd.Series], List[str]]:
+        """Choose once per column how its cells become display strings."""
+
+        if column in FLOAT_FIELDS and pd.api.types.is_float_dtype(dtype):
+            return partial(self._format_float_column, currency=column in CURRENCY_FIELDS)
+        if column == "Total Discount":
+            return partial(self._format_unique_values, formatter=self._format_discount_fraction)
+        if column in CURRENCY_FIELDS:
+            return partial(self._format_unique_values, formatter=self._format_currency)
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return self._format_datetime_column
+        if pd.api.types.is_float_dtype(dtype):
+            return self._format_number_column
+        return partial(self._format_unique_values, formatter=self._format_value)
+
+    def _format_float_column(self, series: pd.Series, currency: bool) -> List[str]:
+        """Columnar equivalent of _format_currency / _format_discount_fraction."""
+
+        values = series.to_numpy(dtype=float)
+        text = np.char.replace(np.char.mod("%.2f", values), ".", ",")
+        if currency:
+            text = np.char.add(text, " €")
+        result = text.astype(object)
+        if currency:
+            blank = ~np.isfinite(values)
+            # Decimal rounds exact halves away from zero, printf does not; defer those
+            ties = series.astype(str).str.contains(r"\.\d\d5$", regex=True).to_numpy(dtype=bool)
+            for pos in np.flatnonzero(ties & ~blank):
+                result[pos] = self._format_currency(values[pos])
+        else:
+            blank = np.isnan(values)
+        result[blank] = ""
+        return result.tolist()
+
+    def _format_datetime_column(self, series: pd.Series) -> List[str]:
+        return series.dt.strftime("%d.%m.%Y").fillna("").tolist()
+
+    def _format_number_column(self, series: pd.Series) -> List[str]:
+        """Columnar equivalent of _format_value for plain float columns."""
+
+        values = series.to_numpy(dtype=float)
+        result = np.char.mod("%.2f", values).astype(object)
+        big = values > 999
+        result[big] = list(map(FMT_BIG, values[big].tolist()))
+        result[np.isnan(values)] = ""
+        return result.tolist()
+
+    def _format_unique_values(self, series: pd.Series, formatter) -> List[str]:
+        """Run ``formatter`` once per distinct value and broadcast the results."""
+
+        codes, uniques = pd.factorize(series)
+        # Missing values get code -1, which picks the trailing empty string
+        lookup = np.array([formatter(value) for value in uniques] + [""], dtype=object)
+        return lookup[codes].tolist()
+
     def next_page(self) -> None:
         if self.current_page < self.total_pages:
             self.current_page += 1
-            self.update_table(self.get_filtered_dataframe())
+            self.update_table(self._get_table_dataframe())
 
     def prev_page(self) -> None:
         if self.current_page > 1:
             self.current_page -= 1
-            self.update_table(self.get_filtered_dataframe())
+            self.update_table(self._get_table_dataframe())
 
     def sort_by_column(self, column: str) -> None:
         if column == "#":
             return
-        df = self.get_filtered_dataframe().sort_values(by=column, na_position="last")
-        self.update_table(df)
+        if column == self._sort_column:
+            self._sort_ascending = not self._sort_ascending
+        else:
+            self._sort_column = column
+            self._sort_ascending = True
+        self._view_cache = None
+        self.update_table(self._get_table_dataframe())
+
+    def _get_table_dataframe(self) -> pd.DataFrame:
+        """Return the filtered frame in the order the table displays it."""
+
+        if self._view_cache is not None:
+            return self._view_cache
+        df = self.get_filtered_dataframe()
+        if self._sort_column:
+            df = df.sort_values(
+                by=self._sort_column, ascending=self._sort_ascending, na_position="last"
+            )
+        self._view_cache = df
+        return df
+
+    def _invalidate_filter_cache(self) -> None:
+        self._filtered_cache = None
+        self._view_cache = None
 
     def get_filtered_dataframe(self) -> pd.DataFrame:
-        df = self.df.copy()
+        # The cache is dropped by apply_filters, which every edit of self.df ends with
+        if self._filtered_cache is None:
+            mask = self._compute_filter_mask()
+            # Readers never modify the result, so an all-True mask can share self.df
+            self._filtered_cache = self.df if mask.all() else self.df.loc[mask]
+        return self._filtered_cache
+
+    def _compute_filter_mask(self) -> pd.Series:
+        """Combine the active filters into one boolean row mask over self.df."""
+
+        df = self.df
         opts = self.filter_options
+        mask = pd.Series(True, index=df.index)
         if opts.search_text:
-            df = df[df["Customer Name"].str.contains(opts.search_text, case=False, na=False)]
+            mask &= df["Customer Name"].str.contains(opts.search_text, case=False, na=False)
         if opts.so_no:
-            df = df[df["SO No"].astype(str).str.contains(opts.so_no, case=False, na=False)]
+            mask &= df["SO No"].astype(str).str.contains(opts.so_no, case=False, na=False)
         if opts.salesman:
-            df = df[df["Sales Man"] == opts.salesman]
+            mask &= df["Sales Man"] == opts.salesman
         if opts.invoiced:
-            df = df[df["Invoiced"].str.upper() == opts.invoiced.upper()]
+            mask &= df["Invoiced"] == opts.invoiced.upper()
         if opts.start_date:
-            df = df[pd.to_datetime(df["Date of Issue"], errors="coerce") >= opts.start_date]
+            mask &= self._get_issue_dates() >= opts.start_date
         if opts.end_date:
-            df = df[pd.to_datetime(df["Date of Issue"], errors="coerce") <= opts.end_date]
-        return df
+            mask &= self._get_issue_dates() <= opts.end_date
+        return mask
+
+    def _get_issue_dates(self) -> pd.Series:
+        """Return "Date of Issue" parsed to datetimes, reusing the last parse."""
+
+        if self._issue_dates is None:
+            self._issue_dates = _parse_date_column(self.df["Date of Issue"])
+        return self._issue_dates
 
     def apply_filters(self) -> None:
+        # Every data mutation and filter change funnels through here
+        self._invalidate_filter_cache()
         self.current_page = 1
-        self.update_table(self.get_filtered_dataframe())
+        self.update_table(self._get_table_dataframe())
 
     # --------------------------------------------------------------- form logic
     def reset_form(self, _event=None, *, preserve_new_mode: bool = False) -> None:
@@ -1573,8 +1995,9 @@ class SalesEntryApp:
                     self.form_vars[col].set(str(value).upper())
                 elif col in ("Date of Request", "Date of Issue", "Date of Delivery"):
                     try:
-                        dt = pd.to_datetime(value)
-                        if pd.isna(dt):
+                        # Table cells hold dd.mm.YYYY text, which strptime reads directly
+                        dt = self._parse_date_str(str(value))
+                        if dt is None or pd.isna(dt):
                             raise ValueError
                         if isinstance(dt, pd.Timestamp):
                             dt = dt.to_pydatetime()
@@ -1612,11 +2035,7 @@ class SalesEntryApp:
                 percent = discount_value * 100
             self.form_vars["DiscountPercent"].set(self._format_percent(percent))
         self._update_cpi_field()
-        try:
-            row_index = int(item["values"][0]) - 1
-        except Exception:
-            row_index = None
-        self.selected_index = row_index
+        self.selected_index = self._frame_label(selected[0])
         self._update_status("Kayıt düzenleme için yüklendi")
         self._new_entry_mode = False
         self._apply_form_state()
@@ -1672,7 +2091,7 @@ class SalesEntryApp:
         if isinstance(value, date):
             return value.strftime("%d.%m.%Y")            
         if isinstance(value, (float, int)):
-            return f"{value:,.2f}" if value > 999 else f"{value:.2f}"
+            return FMT_BIG(value) if value > 999 else FMT_SMALL(value)
         if isinstance(value, str):
             stripped = value.strip()
             if not stripped:
@@ -1696,8 +2115,7 @@ class SalesEntryApp:
     def _parse_float(self, value: str) -> Optional[float]:
         if not value:
             return None
-        cleaned = value.replace("€", "").replace(" ", "").replace("%", "")
-        cleaned = cleaned.replace(".", "").replace(",", ".")
+        cleaned = value.translate(NUMBER_INPUT_TRANSLATION)
         try:
             return float(cleaned)
         except ValueError:
@@ -1719,13 +2137,27 @@ class SalesEntryApp:
             return
         self.form_vars["DiscountPercent"].set(self._format_percent(value))
 
-    def _update_cpi_field(self) -> None:
+    def _on_numeric_keypress(self, proposed: str, widget_name: str) -> bool:
+        field = self._cpi_source_fields.get(widget_name)
+        if field == "Amount":
+            self._update_cpi_field(amount_text=proposed)
+        elif field == "CPS":
+            self._update_cpi_field(cps_text=proposed)
+        return True
+
+    def _update_cpi_field(
+        self, amount_text: Optional[str] = None, cps_text: Optional[str] = None
+    ) -> None:
         if self._updating_cpi_field:
             return
         self._updating_cpi_field = True
         try:
-            amount_value = self._parse_float(self.form_vars["Amount"].get())
-            cps_value = self._parse_float(self.form_vars["CPS"].get())
+            if amount_text is None:
+                amount_text = self.form_vars["Amount"].get()
+            if cps_text is None:
+                cps_text = self.form_vars["CPS"].get()
+            amount_value = self._parse_float(amount_text)
+            cps_value = self._parse_float(cps_text)
             if amount_value is None:
                 self.form_vars["Invoiced Amount"].set("")
                 return
@@ -1855,8 +2287,7 @@ class SalesEntryApp:
             return
 
         self._push_history()
-
-        self.df = pd.concat([self.df, record.to_frame().T], ignore_index=True)
+        self._append_record(record)
         self.save_current_dataframe()
         self.apply_filters()
         self.reset_form()
@@ -1880,7 +2311,10 @@ class SalesEntryApp:
         if not confirm:
             return
         self._push_history()
-        self.df.loc[self.selected_index, record.index] = record.values
+        record = self._prepare_record_for_frame(record)
+        self._add_missing_categories(record)
+        for column, value in record.items():
+            self.df.at[self.selected_index, column] = value
         self.save_current_dataframe()
         self.apply_filters()
         self.reset_form()
@@ -1900,10 +2334,11 @@ class SalesEntryApp:
         )
         if not confirm:
             return
-        item = self.tree.item(selected[0])
-        index = int(item["values"][0]) - 1
+        label = self._frame_label(selected[0])
+        if label is None:
+            return
         self._push_history()
-        self.df = self.df.drop(self.df.index[index]).reset_index(drop=True)
+        self.df = self.df.drop(label).reset_index(drop=True)
         self.save_current_dataframe()
         self.apply_filters()
         self.reset_form()
@@ -1997,13 +2432,15 @@ class SalesEntryApp:
     def _parse_date_str(self, value: str) -> Optional[datetime]:
         if not value:
             return None
-        try:
-            return datetime.strptime(value, "%d.%m.%Y")
-        except ValueError:
+        for fmt in DATE_TEXT_FORMATS:
             try:
-                return pd.to_datetime(value, dayfirst=True)
-            except Exception:
-                return None
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        try:
+            return pd.to_datetime(value, dayfirst=True)
+        except Exception:
+            return None
 
     # ------------------------------------------------------------- reporting
     def _show_reporting_dashboard(self, df: pd.DataFrame) -> None:
@@ -2029,7 +2466,7 @@ class SalesEntryApp:
         for col in ("Amount", "CPI", "CPS", "Invoiced Amount"):
             if col in data:
                 data[col] = pd.to_numeric(data[col], errors="coerce")
-        data["Sales Man"] = data.get("Sales Man", "").fillna("Bilinmiyor").astype(str)
+        data["Sales Man"] = data.get("Sales Man", "").astype(object).fillna("Bilinmiyor").astype(str)
         data["Invoiced"] = data.get("Invoiced", "").astype(str).str.upper()
         data["Date of Delivery"] = pd.to_datetime(data.get("Date of Delivery"), errors="coerce")
 
@@ -2315,12 +2752,17 @@ class SalesEntryApp:
         )
         sales_rows = [
             (
-                row["Sales Man"],
-                format_currency(row["Amount"]),
-                format_currency(row["CPI"]),
-                format_currency(row["CPS"]),
+                sales_man,
+                format_currency(amount),
+                format_currency(cpi),
+                format_currency(cps),
+            )
+            for sales_man, amount, cpi, cps in zip(
+                grouped_sales["Sales Man"].to_numpy(),
+                grouped_sales["Amount"].to_numpy(),
+                grouped_sales["CPI"].to_numpy(),
+                grouped_sales["CPS"].to_numpy(),
             )
-            for _, row in grouped_sales.iterrows()
         ]
         sales_table = ttk.Frame(sales_frame, style="Card.TFrame")
         sales_table.grid(row=0, column=0, sticky="nsew", padx=(0, 12))
@@ -2362,12 +2804,17 @@ class SalesEntryApp:
         )
         invoiced_sales_rows = [
             (
-                row["Sales Man"],
-                format_currency(row["Invoiced Amount"]),
-                format_currency(row["CPI"]),
-                format_currency(row["CPS"]),
+                sales_man,
+                format_currency(invoiced_amount),
+                format_currency(cpi),
+                format_currency(cps),
+            )
+            for sales_man, invoiced_amount, cpi, cps in zip(
+                invoiced_grouped["Sales Man"].to_numpy(),
+                invoiced_grouped["Invoiced Amount"].to_numpy(),
+                invoiced_grouped["CPI"].to_numpy(),
+                invoiced_grouped["CPS"].to_numpy(),
             )
-            for _, row in invoiced_grouped.iterrows()
         ]
         invoiced_sales_table = ttk.Frame(invoiced_sales_frame, style="Card.TFrame")
         invoiced_sales_table.grid(row=0, column=0, sticky="nsew", padx=(0, 12))
@@ -2399,12 +2846,17 @@ class SalesEntryApp:
             monthly = monthly.assign(Ay=pd.Series(dtype=str))
         monthly_rows = [
             (
-                row.get("Ay", "-"),
-                format_currency(row.get("Amount", 0)),
-                format_currency(row.get("CPI", 0)),
-                format_currency(row.get("CPS", 0)),
+                label,
+                format_currency(amount),
+                format_currency(cpi),
+                format_currency(cps),
+            )
+            for label, amount, cpi, cps in zip(
+                monthly["Ay"].to_numpy(),
+                monthly["Amount"].to_numpy(),
+                monthly["CPI"].to_numpy(),
+                monthly["CPS"].to_numpy(),
             )
-            for _, row in monthly.iterrows()
         ]
         forecast_table = ttk.Frame(forecast_frame, style="Card.TFrame")
         forecast_table.grid(row=0, column=0, sticky="nsew", padx=(0, 12))
@@ -2435,11 +2887,21 @@ class SalesEntryApp:
         progress = ttk.Progressbar(progress_window, orient="horizontal", length=280, mode="determinate")
         progress.pack(padx=16, pady=12)
 
-        def update_progress(value: float, message: str) -> None:
+        last_update = {"time": 0.0}
+
+        def show_progress(value: float, message: str) -> None:
             progress["value"] = value * 100
-            progress_window.update_idletasks()
             self._update_status(message)
 
+        def update_progress(value: float, message: str) -> None:
+            # Runs on the worker thread: let Tk's loop apply the ticks, throttled
+            # on elapsed time only; the final tick always goes through
+            now = time.monotonic()
+            if value < 1.0 and now - last_update["time"] < PROGRESS_UPDATE_INTERVAL:
+                return
+            last_update["time"] = now
+            self.root.after(0, show_progress, value, message)
+
         def worker() -> None:
             try:
                 sales_reporting.generate_sales_report(
@@ -2447,11 +2909,11 @@ class SalesEntryApp:
                     str(output_file),
                     progress_callback=update_progress,
                 )
-                messagebox.showinfo("Başarılı", f"Rapor oluşturuldu: {output_file}")
+                self.root.after(0, partial(messagebox.showinfo, "Başarılı", f"Rapor oluşturuldu: {output_file}"))
             except Exception as exc:
-                messagebox.showerror("Rapor Hatası", str(exc))
+                self.root.after(0, partial(messagebox.showerror, "Rapor Hatası", str(exc)))
             finally:
-                progress_window.destroy()
+                self.root.after(0, progress_window.destroy)
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -2469,6 +2931,10 @@ class SalesEntryApp:
     def show_about(self) -> None:
         messagebox.showinfo("Hakkında", "Satış Veri Giriş Sistemi\nSürüm 1.0")
 
+    def _on_close(self) -> None:
+        self._close_excel_file()
+        self.root.destroy()
+
     def run(self) -> None:
         self.root.mainloop()
 
@@ -15,17 +15,26 @@ is intentionally self-contained so it can be executed as a script:
 from __future__ import annotations
 
 import argparse
+import math
 import os
 import re
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from difflib import get_close_matches
 from typing import Callable, Iterable, Optional
 
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.chart import BarChart, LineChart, Reference
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 
+try:  # Optional dependency: Rust-backed reader, much faster than openpyxl
+    import python_calamine  # noqa: F401
+except ImportError:  # pragma: no cover - runtime guard
+    python_calamine = None  # type: ignore[assignment]
+
+EXCEL_READ_ENGINE = "calamine" if python_calamine is not None else "openpyxl"
+
 
 REQUIRED_COLUMNS = [
     "Date of Request",
@@ -50,7 +59,15 @@ REQUIRED_COLUMNS = [
 ]
 
 DATE_COLUMNS = ["Date of Request", "Date of Issue", "Date of Delivery"]
+DATE_FORMATS = ("%d.%m.%Y", "%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y")
 CURRENCY_COLUMNS = ["Amount", "Total Discount", "CPI", "CPS", "Invoiced Amount"]
+# Drops spaces and thousands dots and turns the decimal comma into a dot
+CURRENCY_TRANSLATION = str.maketrans({" ": None, ".": None, ",": "."})
+CATEGORY_COLUMNS = ["Sales Man", "Customer Name", "MonthName", "MonthYear"]
+
+# Number formats ``DataFrame.to_excel`` gives datetime and date cells
+EXCEL_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+EXCEL_DATE_FORMAT = "YYYY-MM-DD"
 
 COLUMN_SYNONYMS = {
     "dateofrequest": {"requestdate", "talepdate", "taleptarihi"},
@@ -82,6 +99,8 @@ COLUMN_SYNONYMS = {
 
 STOPWORDS = {"of", "the", "no"}
 
+TRUTHY_VALUES = {"yes", "evet", "true", "1", "y", "invoiced"}
+
 TURKISH_MONTHS = {
     1: "Ocak",
     2: "Şubat",
@@ -97,6 +116,47 @@ TURKISH_MONTHS = {
     12: "Aralık",
 }
 
+# Rows converted per batch when streaming a table into a write-only sheet
+WRITE_CHUNK_ROWS = 10_000
+
+# Shared cell styles. Every report cell is assigned these same instances
+# through _styled_cell instead of building new style objects per cell.
+HEADER_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+HEADER_FONT = Font(color="FFFFFF", bold=True)
+CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+LEFT_ALIGNMENT = Alignment(horizontal="left")
+TABLE_BORDER = Border(
+    top=Side(border_style="thin", color="D9D9D9"),
+    bottom=Side(border_style="thin", color="D9D9D9"),
+    left=Side(border_style="thin", color="D9D9D9"),
+    right=Side(border_style="thin", color="D9D9D9"),
+)
+HEADER_STYLE = {
+    "fill": HEADER_FILL,
+    "font": HEADER_FONT,
+    "alignment": CENTER_ALIGNMENT,
+    "border": TABLE_BORDER,
+}
+BODY_STYLE = {"border": TABLE_BORDER}
+FIRST_COLUMN_STYLE = {"alignment": LEFT_ALIGNMENT, "border": TABLE_BORDER}
+
+TITLE_FONT = Font(size=14, bold=True)
+BOLD_FONT = Font(bold=True)
+VALUE_ALIGNMENT = Alignment(horizontal="left", vertical="center")
+AMOUNT_ALIGNMENT = Alignment(horizontal="right", vertical="center")
+STATUS_FILL = PatternFill(start_color="FFF4CE", end_color="FFF4CE", fill_type="solid")
+STATUS_BORDER = Border(
+    top=Side(border_style="thin", color="E0E0E0"),
+    bottom=Side(border_style="thin", color="E0E0E0"),
+    left=Side(border_style="thin", color="E0E0E0"),
+    right=Side(border_style="thin", color="E0E0E0"),
+)
+TITLE_STYLE = {"font": TITLE_FONT, "alignment": CENTER_ALIGNMENT}
+VALUE_STYLE = {"alignment": VALUE_ALIGNMENT, "border": TABLE_BORDER}
+AMOUNT_STYLE = {"alignment": AMOUNT_ALIGNMENT, "border": TABLE_BORDER}
+STATUS_TITLE_STYLE = {"font": BOLD_FONT}
+STATUS_STYLE = {"alignment": VALUE_ALIGNMENT, "fill": STATUS_FILL, "border": STATUS_BORDER}
+
 
 def _normalise_column_key(name: str) -> str:
     return "".join(ch for ch in str(name).strip().lower() if ch.isalnum())
@@ -163,15 +223,18 @@ def _match_required_columns(columns: Iterable[str]) -> tuple[dict[str, str], lis
 
 
 def read_and_clean_data(filepath: str) -> pd.DataFrame:
-    """Read the Excel file and perform initial validation and cleaning."""
+    """Read the Excel or Parquet file and perform initial validation and cleaning."""
 
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Girdi dosyası bulunamadı: {filepath}")
 
     try:
-        df = pd.read_excel(filepath)
+        if str(filepath).lower().endswith(".parquet"):
+            df = pd.read_parquet(filepath)
+        else:
+            df = pd.read_excel(filepath, engine=EXCEL_READ_ENGINE)
     except Exception as exc:  # pragma: no cover - defensive
-        raise RuntimeError(f"Excel dosyası okunamadı: {exc}") from exc
+        raise RuntimeError(f"Veri dosyası okunamadı: {exc}") from exc
 
     rename_map, missing_columns = _match_required_columns(df.columns)
     if rename_map:
@@ -187,27 +250,26 @@ def read_and_clean_data(filepath: str) -> pd.DataFrame:
         )
 
     for date_col in DATE_COLUMNS:
-        df[date_col] = df[date_col].apply(parse_turkish_date)
+        df[date_col] = parse_date_column(df[date_col])
 
     for currency_col in CURRENCY_COLUMNS:
-        df[currency_col] = pd.to_numeric(
-            df[currency_col].apply(clean_currency_value), errors="coerce"
-        )
+        df[currency_col] = clean_currency_column(df[currency_col])
 
     df["QI Forecast"] = df["QI Forecast"].astype(str).str.strip().str.upper()
-    df["Invoiced"] = df["Invoiced"].apply(normalise_boolean)
+    # Same rule as normalise_boolean; str() of NaN/None never matches a truthy value
+    df["Invoiced"] = df["Invoiced"].astype(str).str.strip().str.lower().isin(TRUTHY_VALUES)
 
     df["Year"] = df["Date of Issue"].dt.year
     df["MonthNumber"] = df["Date of Issue"].dt.month
     df["MonthName"] = df["MonthNumber"].map(TURKISH_MONTHS)
-    df["MonthYear"] = (
-        df.apply(
-            lambda row: f"{int(row['Year'])} {row['MonthName']}"
-            if pd.notna(row["Year"]) and pd.notna(row["MonthName"])
-            else None,
-            axis=1,
-        )
-    )
+    has_month = df["Year"].notna() & df["MonthName"].notna()
+    labels = df.loc[has_month, "Year"].astype(int).astype(str) + " " + df.loc[has_month, "MonthName"]
+    df["MonthYear"] = labels.reindex(df.index).astype(object).where(has_month, None)
+
+    # Repeated labels as category codes: groupby and pivot hash small ints.
+    # Currency columns stay float64 so report totals keep full precision.
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype("category")
 
     return df
 
@@ -223,7 +285,7 @@ def parse_turkish_date(value: object) -> Optional[pd.Timestamp]:
 
     str_value = str(value).strip()
 
-    for fmt in ("%d.%m.%Y", "%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y"):
+    for fmt in DATE_FORMATS:
         try:
             return pd.to_datetime(datetime.strptime(str_value, fmt))
         except ValueError:
@@ -235,6 +297,43 @@ def parse_turkish_date(value: object) -> Optional[pd.Timestamp]:
         return pd.NaT
 
 
+def parse_date_column(series: pd.Series) -> pd.Series:
+    """Column-wise :func:`parse_turkish_date`.
+
+    Text cells are tried against each of ``DATE_FORMATS`` with pandas' parser
+    and datetime objects are converted directly; the few values left over go
+    through :func:`parse_turkish_date` so the fallback rules stay identical.
+    """
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    values = series.astype(object)
+    result = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+    pending = values.notna() & (values != "")
+
+    is_datetime = pending & values.map(lambda value: isinstance(value, datetime))
+    if is_datetime.any():
+        result[is_datetime] = pd.to_datetime(values[is_datetime])
+    pending &= ~is_datetime
+
+    is_text = pending & values.map(lambda value: isinstance(value, str))
+    text = values[is_text].str.strip()
+    for fmt in DATE_FORMATS:
+        if text.empty:
+            break
+        parsed = pd.to_datetime(text, format=fmt, errors="coerce")
+        matched = parsed.notna()
+        result[parsed.index[matched]] = parsed[matched]
+        text = text[~matched]
+    pending &= ~is_text
+    pending[text.index] = True
+
+    if pending.any():
+        result[pending] = values[pending].map(parse_turkish_date)
+    return result
+
+
 def clean_currency_value(value: object) -> Optional[float]:
     """Convert strings such as '€ 1.234,56' to floats."""
 
@@ -255,6 +354,35 @@ def clean_currency_value(value: object) -> Optional[float]:
         return None
 
 
+def clean_currency_column(series: pd.Series) -> pd.Series:
+    """Column-wise :func:`clean_currency_value`, returning a float Series."""
+
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+
+    values = series.astype(object)
+    result = pd.Series(float("nan"), index=series.index)
+    is_text = values.map(lambda value: isinstance(value, str))
+
+    cleaned = (
+        values[is_text]
+        .str.replace("€", "", regex=False)
+        .str.replace("TL", "", regex=False)
+        .str.translate(CURRENCY_TRANSLATION)
+    )
+    numbers = pd.to_numeric(cleaned, errors="coerce")
+    # float() accepts a few spellings pandas does not; re-check only the misses
+    missed = numbers.isna() & (cleaned != "")
+    if missed.any():
+        numbers[missed] = pd.to_numeric(cleaned[missed].map(clean_currency_value), errors="coerce")
+    result[is_text] = numbers
+
+    others = values.notna() & ~is_text
+    if others.any():
+        result[others] = pd.to_numeric(values[others].map(clean_currency_value), errors="coerce")
+    return result
+
+
 def clean_percentage_value(value: object) -> Optional[float]:
     """Convert percentage strings to floating ratios (e.g. '%50,0' -> 0.5)."""
 
@@ -284,23 +412,29 @@ def normalise_boolean(value: object) -> bool:
         return False
 
     str_value = str(value).strip().lower()
-    return str_value in {"yes", "evet", "true", "1", "y", "invoiced"}
-
-
-def filter_monthly_data(df: pd.DataFrame, column: str) -> pd.DataFrame:
-    """Aggregate CPI values by month keeping chronological order."""
-
-    grouped = (
-        df.dropna(subset=["MonthYear", "MonthNumber"])
-        .groupby(["Year", "MonthNumber", "MonthName", "MonthYear"], as_index=False)[
-            column
-        ]
-        .sum()
+    return str_value in TRUTHY_VALUES
+
+
+def filter_monthly_data(df: pd.DataFrame, column: str, mask: Optional[pd.Series] = None) -> pd.DataFrame:
+    """Aggregate CPI values by month keeping chronological order.
+
+    When ``mask`` is given only the matching rows are aggregated.
+    """
+
+    if mask is not None:
+        df = df.loc[mask]
+    dated = df.dropna(subset=["MonthYear", "MonthNumber"])
+    # One int32 month ordinal as the group key; the display columns are
+    # constant within a month, so ``first`` carries them over
+    month_key = (dated["Year"] * 12 + dated["MonthNumber"]).astype("int32")
+    grouped = dated.groupby(month_key).agg(
+        Year=("Year", "first"),
+        MonthNumber=("MonthNumber", "first"),
+        MonthName=("MonthName", "first"),
+        MonthYear=("MonthYear", "first"),
+        Toplam=(column, "sum"),
     )
-
-    grouped = grouped.sort_values(["Year", "MonthNumber"])
-    grouped.rename(columns={column: "Toplam"}, inplace=True)
-    return grouped
+    return grouped.reset_index(drop=True)
 
 
 def pivot_salesman_monthly(df: pd.DataFrame, value_column: str) -> pd.DataFrame:
@@ -309,34 +443,80 @@ def pivot_salesman_monthly(df: pd.DataFrame, value_column: str) -> pd.DataFrame:
     pivot = (
         df.dropna(subset=["MonthYear"])
         .pivot_table(
-            index="MonthYear",
+            index=["Year", "MonthNumber"],
             columns="Sales Man",
             values=value_column,
             aggfunc="sum",
             fill_value=0.0,
+            observed=True,
         )
-        .sort_index(key=lambda idx: idx.map(_month_year_sort_key))
+        .sort_index()
     )
 
-    pivot.reset_index(inplace=True)
-    return pivot
+    pivot.insert(0, "MonthYear", _month_year_labels(pivot.index))
+    return pivot.reset_index(drop=True)
+
 
+def _month_year_labels(index: pd.MultiIndex) -> list[str]:
+    """Return the ``MonthYear`` label for each ``(Year, MonthNumber)`` entry."""
 
-def _month_year_sort_key(label: str) -> tuple[int, int]:
-    year_str, month_name = label.split(" ", 1)
-    month_number = next((k for k, v in TURKISH_MONTHS.items() if v == month_name), 0)
-    return int(year_str), month_number
+    return [f"{int(year)} {TURKISH_MONTHS[int(month)]}" for year, month in index]
 
 
 def salesperson_totals(df: pd.DataFrame, value_column: str) -> pd.DataFrame:
     totals = (
-        df.groupby("Sales Man", as_index=False)[value_column].sum().sort_values(
+        df.groupby("Sales Man", as_index=False, observed=True)[value_column].sum().sort_values(
             value_column, ascending=False
         )
     )
     return totals
 
 
+def category_reports(
+    df: pd.DataFrame, categories: dict[str, pd.Series], value_column: str
+) -> dict[str, tuple[pd.DataFrame, pd.DataFrame]]:
+    """Return ``(monthly pivot, salesman totals)`` for several row subsets at once.
+
+    ``categories`` maps a name to a boolean row mask and the subsets may
+    overlap. They are stacked under a ``_category`` key so one groupby serves
+    all of them; each pair matches :func:`pivot_salesman_monthly` and
+    :func:`salesperson_totals` run on that subset alone.
+    """
+
+    stacked = pd.concat(
+        {
+            name: df.loc[mask, ["Year", "MonthNumber", "Sales Man", value_column]]
+            for name, mask in categories.items()
+        },
+        names=["_category", None],
+    ).reset_index(level="_category")
+    totals = stacked.groupby(["_category", "Sales Man"], observed=True)[value_column].sum()
+    cells = (
+        stacked.dropna(subset=["Year", "MonthNumber"])
+        .groupby(["_category", "Year", "MonthNumber", "Sales Man"], observed=True)[value_column]
+        .sum()
+    )
+    with_totals = set(totals.index.unique(level="_category"))
+    with_cells = set(cells.index.unique(level="_category"))
+
+    reports: dict[str, tuple[pd.DataFrame, pd.DataFrame]] = {}
+    for name in categories:
+        if name in with_cells:
+            # unstack keeps the level's code order; pivot_table sorts salesmen
+            pivot = cells.xs(name, level="_category").unstack("Sales Man", fill_value=0.0)
+            pivot = pivot.sort_index().sort_index(axis=1)
+            pivot.insert(0, "MonthYear", _month_year_labels(pivot.index))
+            pivot = pivot.reset_index(drop=True)
+        else:
+            pivot = pd.DataFrame(columns=["MonthYear"])
+        if name in with_totals:
+            subset_totals = totals.xs(name, level="_category").reset_index()
+        else:
+            subset_totals = pd.DataFrame({"Sales Man": pd.Series(dtype=object), value_column: pd.Series(dtype=float)})
+        reports[name] = (pivot, subset_totals.sort_values(value_column, ascending=False))
+    return reports
+
+
 def add_chart(
     workbook_sheet,
     data_range,
@@ -367,41 +547,90 @@ def add_chart(
     workbook_sheet.add_chart(chart, "H2")
 
 
-def apply_table_formatting(sheet, start_row: int, start_col: int, end_row: int, end_col: int):
-    """Apply header styling and borders to a rectangular table."""
-
-    header_fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True)
-    thin = Side(border_style="thin", color="D9D9D9")
-    border = Border(top=thin, bottom=thin, left=thin, right=thin)
-
-    for col in range(start_col, end_col + 1):
-        cell = sheet.cell(row=start_row, column=col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    for row in range(start_row, end_row + 1):
-        for col in range(start_col, end_col + 1):
-            cell = sheet.cell(row=row, column=col)
-            cell.border = border
-            if row > start_row and col == start_col:
-                cell.alignment = Alignment(horizontal="left")
+def _excel_value(value) -> tuple[object, Optional[str]]:
+    """Return ``value`` and its number format as ``DataFrame.to_excel`` stores them."""
 
-
-def write_dataframe(
-    writer: pd.ExcelWriter,
-    df: pd.DataFrame,
-    sheet_name: str,
-    startrow: int = 0,
-    startcol: int = 0,
-    index: bool = False,
-):
-    df.to_excel(writer, sheet_name=sheet_name, startrow=startrow, startcol=startcol, index=index)
-    sheet = writer.sheets[sheet_name]
-    end_row = startrow + len(df) + (0 if index else 1)
-    end_col = startcol + len(df.columns)
-    apply_table_formatting(sheet, startrow + 1, startcol + 1, end_row, end_col)
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return "", None
+    if pd.api.types.is_integer(value):
+        return int(value), None
+    if pd.api.types.is_float(value):
+        if math.isinf(value):
+            return ("inf" if value > 0 else "-inf"), None
+        return float(value), None
+    if pd.api.types.is_bool(value):
+        return bool(value), None
+    if isinstance(value, datetime):
+        return value, EXCEL_DATETIME_FORMAT
+    if isinstance(value, date):
+        return value, EXCEL_DATE_FORMAT
+    if isinstance(value, timedelta):
+        return value.total_seconds() / 86400, "0"
+    return str(value), None
+
+
+def _styled_cell(sheet, value, style: dict, number_format: Optional[str] = None) -> WriteOnlyCell:
+    """Return a write-only cell holding ``value`` with one of the shared styles."""
+
+    cell = WriteOnlyCell(sheet, value=value)
+    for name, shared in style.items():
+        setattr(cell, name, shared)
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def _excel_float(value: float) -> object:
+    if value != value:
+        return ""
+    if math.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    return value
+
+
+def _excel_column(series: pd.Series) -> list[tuple[object, Optional[str]]]:
+    """Return :func:`_excel_value` for every item of ``series``.
+
+    Plain numpy numeric and datetime columns are converted by dtype in one
+    pass; anything else goes through ``_excel_value`` item by item.
+    """
+
+    values = series.tolist()
+    kind = series.dtype.kind if type(series.dtype).__module__ == "numpy" else "O"
+    if kind in "biu":
+        return [(value, None) for value in values]
+    if kind == "f":
+        return [(_excel_float(value), None) for value in values]
+    if kind == "M":
+        return [("", None) if pd.isna(value) else (value, EXCEL_DATETIME_FORMAT) for value in values]
+    return [_excel_value(value) for value in values]
+
+
+def write_dataframe(sheet, df: pd.DataFrame, gap_rows: int = 0) -> None:
+    """Append ``df`` to a write-only ``sheet`` as a styled table.
+
+    ``gap_rows`` blank rows are written first. Cells carry the same values
+    a ``to_excel`` table gets, plus the shared header and border styles.
+    Values are converted column by column, ``WRITE_CHUNK_ROWS`` rows at a
+    time so the converted buffers stay small on large frames.
+    """
+
+    for _ in range(gap_rows):
+        sheet.append([])
+
+    header = [_excel_value(column) for column in df.columns]
+    sheet.append([_styled_cell(sheet, value, HEADER_STYLE, number_format) for value, number_format in header])
+
+    for start in range(0, len(df), WRITE_CHUNK_ROWS):
+        chunk = df.iloc[start : start + WRITE_CHUNK_ROWS]
+        columns = [_excel_column(chunk.iloc[:, position]) for position in range(chunk.shape[1])]
+        for row in zip(*columns):
+            sheet.append(
+                [
+                    _styled_cell(sheet, value, FIRST_COLUMN_STYLE if position == 0 else BODY_STYLE, number_format)
+                    for position, (value, number_format) in enumerate(row)
+                ]
+            )
 
 
 def _format_currency_display(value) -> str:
@@ -455,7 +684,7 @@ def _sanitise_sheet_title(base: str, existing: set[str]) -> str:
 
 def _add_detail_sheets(workbook, df: pd.DataFrame) -> None:
     existing = set(workbook.sheetnames)
-    for idx, (_, row) in enumerate(df.reset_index(drop=True).iterrows(), start=1):
+    for idx, row in enumerate(df.to_dict("records"), start=1):
         customer_name = str(row.get("Customer Name", "") or "").strip()
         base_title = f"Kayıt {idx:03d}"
         if customer_name:
@@ -463,31 +692,26 @@ def _add_detail_sheets(workbook, df: pd.DataFrame) -> None:
         sheet_name = _sanitise_sheet_title(base_title, existing)
         sheet = workbook.create_sheet(title=sheet_name)
         sheet.sheet_view.showGridLines = False
+        # Write-only sheets take row and column settings before any cell
+        sheet.row_dimensions[1].height = 26
+        sheet.column_dimensions["A"].width = 28
+        sheet.column_dimensions["B"].width = 48
+        sheet.column_dimensions["D"].width = 22
+        sheet.column_dimensions["E"].width = 18
+        sheet.merged_cells.add("A1:H1")
 
-        sheet.merge_cells(start_row=1, start_column=1, end_row=1, end_column=8)
         title = customer_name or "Müşteri Bilgisi Yok"
-        title_cell = sheet.cell(row=1, column=1, value=f"Kayıt #{idx} — {title}")
-        title_cell.font = Font(size=14, bold=True)
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-        sheet.row_dimensions[1].height = 26
+        sheet.append([_styled_cell(sheet, f"Kayıt #{idx} — {title}", TITLE_STYLE)])
+        sheet.append([])
 
         detail_header_row = 3
-        sheet.cell(row=detail_header_row, column=1, value="Alan")
-        sheet.cell(row=detail_header_row, column=2, value="Değer")
-
-        for row_offset, column_name in enumerate(df.columns, start=detail_header_row + 1):
-            sheet.cell(row=row_offset, column=1, value=column_name)
-            value_cell = sheet.cell(
-                row=row_offset,
-                column=2,
-                value=_format_detail_value(column_name, row[column_name]),
-            )
-            value_cell.alignment = Alignment(horizontal="left", vertical="center")
-
-        detail_end_row = detail_header_row + len(df.columns)
-        apply_table_formatting(sheet, detail_header_row, 1, detail_end_row, 2)
-        sheet.column_dimensions["A"].width = 28
-        sheet.column_dimensions["B"].width = 48
+        detail_rows = [
+            [
+                _styled_cell(sheet, column_name, FIRST_COLUMN_STYLE),
+                _styled_cell(sheet, _format_detail_value(column_name, row[column_name]), VALUE_STYLE),
+            ]
+            for column_name in df.columns
+        ]
 
         metrics = [
             ("Toplam Tutar", row.get("Amount", 0)),
@@ -496,11 +720,8 @@ def _add_detail_sheets(workbook, df: pd.DataFrame) -> None:
             ("Fatura Tutarı", row.get("Invoiced Amount", 0)),
         ]
         metric_header_row = detail_header_row
-        sheet.cell(row=metric_header_row, column=4, value="Metrik")
-        sheet.cell(row=metric_header_row, column=5, value="Tutar")
-
-        for metric_offset, (label, metric_value) in enumerate(metrics, start=metric_header_row + 1):
-            sheet.cell(row=metric_offset, column=4, value=label)
+        metric_rows = []
+        for label, metric_value in metrics:
             if pd.isna(metric_value):
                 numeric_value = 0.0
             else:
@@ -508,14 +729,41 @@ def _add_detail_sheets(workbook, df: pd.DataFrame) -> None:
                     numeric_value = float(metric_value)
                 except (TypeError, ValueError):
                     numeric_value = 0.0
-            value_cell = sheet.cell(row=metric_offset, column=5, value=numeric_value)
-            value_cell.number_format = "#,##0.00"
-            value_cell.alignment = Alignment(horizontal="right", vertical="center")
-
+            metric_rows.append(
+                [
+                    _styled_cell(sheet, label, FIRST_COLUMN_STYLE),
+                    _styled_cell(sheet, numeric_value, AMOUNT_STYLE, "#,##0.00"),
+                ]
+            )
         metric_end_row = metric_header_row + len(metrics)
-        apply_table_formatting(sheet, metric_header_row, 4, metric_end_row, 5)
-        sheet.column_dimensions["D"].width = 22
-        sheet.column_dimensions["E"].width = 18
+
+        sheet.append(
+            [
+                _styled_cell(sheet, "Alan", HEADER_STYLE),
+                _styled_cell(sheet, "Değer", HEADER_STYLE),
+                None,
+                _styled_cell(sheet, "Metrik", HEADER_STYLE),
+                _styled_cell(sheet, "Tutar", HEADER_STYLE),
+            ]
+        )
+        for offset in range(max(len(detail_rows), len(metric_rows))):
+            detail_pair = detail_rows[offset] if offset < len(detail_rows) else [None, None]
+            metric_pair = metric_rows[offset] if offset < len(metric_rows) else []
+            sheet.append(detail_pair + [None] + metric_pair)
+        sheet.append([])  # status summary sits one row below the detail table
+
+        invoiced_text = _format_detail_value("Invoiced", row.get("Invoiced"))
+        forecast_text = str(row.get("QI Forecast", "") or "-")
+        sheet.append(
+            [
+                _styled_cell(sheet, "Durum Özeti", STATUS_TITLE_STYLE),
+                _styled_cell(
+                    sheet,
+                    f"Faturalama: {invoiced_text} | QI Forecast: {forecast_text}",
+                    STATUS_STYLE,
+                ),
+            ]
+        )
 
         chart = BarChart()
         chart.style = 4
@@ -529,29 +777,11 @@ def _add_detail_sheets(workbook, df: pd.DataFrame) -> None:
         chart.width = 16
         sheet.add_chart(chart, f"G{metric_header_row}")
 
-        status_row = detail_end_row + 2
-        status_title = sheet.cell(row=status_row, column=1, value="Durum Özeti")
-        status_title.font = Font(bold=True)
-        invoiced_text = _format_detail_value("Invoiced", row.get("Invoiced"))
-        forecast_text = str(row.get("QI Forecast", "") or "-")
-        status_value = sheet.cell(
-            row=status_row,
-            column=2,
-            value=f"Faturalama: {invoiced_text} | QI Forecast: {forecast_text}",
-        )
-        status_value.alignment = Alignment(horizontal="left", vertical="center")
-        status_value.fill = PatternFill(start_color="FFF4CE", end_color="FFF4CE", fill_type="solid")
-        thin = Side(border_style="thin", color="E0E0E0")
-        status_value.border = Border(top=thin, bottom=thin, left=thin, right=thin)
 
-
-def _add_summary_visuals(workbook, summary_length: int) -> None:
-    if "Özet Dashboard" not in workbook.sheetnames or summary_length <= 0:
+def _add_summary_visuals(sheet, summary_length: int) -> None:
+    if summary_length <= 0:
         return
-    sheet = workbook["Özet Dashboard"]
     max_summary_row = summary_length + 1
-    if sheet.max_row < max_summary_row:
-        return
 
     chart = BarChart()
     chart.style = 10
@@ -582,117 +812,88 @@ def generate_sales_report(
     df = read_and_clean_data(input_file)
     report_progress(2, total_steps, f"Toplam kayıt sayısı: {len(df)}")
 
-    invoiced_df = df[df["Invoiced"] == True]
-    not_invoiced_df = df[df["Invoiced"] == False]
-    won_df = df[df["QI Forecast"].str.upper() == "YES"]
-
-    invoiced_monthly = filter_monthly_data(invoiced_df, "CPI")
-    not_invoiced_monthly = filter_monthly_data(not_invoiced_df, "CPI")
-    won_monthly = filter_monthly_data(won_df, "CPI")
-
-    invoiced_pivot = pivot_salesman_monthly(invoiced_df, "CPI")
-    not_invoiced_pivot = pivot_salesman_monthly(not_invoiced_df, "CPI")
-    won_pivot = pivot_salesman_monthly(won_df, "CPI")
-
-    salesperson_summary = salesperson_totals(df, "CPI")
-    invoiced_salesperson = salesperson_totals(invoiced_df, "CPI")
-    not_invoiced_salesperson = salesperson_totals(not_invoiced_df, "CPI")
-    won_salesperson = salesperson_totals(won_df, "CPI")
-
-    summary_metrics = pd.DataFrame(
-        [
-            {"Metrik": "Toplam CPI", "Değer": df["CPI"].sum()},
-            {"Metrik": "Faturalanan CPI", "Değer": invoiced_df["CPI"].sum()},
-            {"Metrik": "Faturalanmayan CPI", "Değer": not_invoiced_df["CPI"].sum()},
-            {"Metrik": "Kazanılan CPI", "Değer": won_df["CPI"].sum()},
-            {"Metrik": "Satış Elemanı Sayısı", "Değer": df["Sales Man"].nunique()},
-        ]
+    # "Invoiced" is a bool column and "QI Forecast" is upper-cased by
+    # read_and_clean_data; the subsets are only summed and counted, never
+    # materialised
+    invoiced_mask = df["Invoiced"]
+    not_invoiced_mask = ~invoiced_mask
+    won_mask = df["QI Forecast"] == "YES"
+
+    reports = category_reports(
+        df,
+        {"invoiced": invoiced_mask, "not_invoiced": not_invoiced_mask, "won": won_mask},
+        "CPI",
     )
-
-    if df["MonthYear"].notna().any():
-        month_counts = df.dropna(subset=["MonthYear"])["MonthYear"].nunique()
-        avg_cpi = df["CPI"].sum() / month_counts if month_counts else 0
-    else:
-        avg_cpi = 0
-
-    summary_metrics.loc[len(summary_metrics.index)] = {
-        "Metrik": "Aylık Ortalama CPI",
-        "Değer": avg_cpi,
-    }
+    salesperson_summary = salesperson_totals(df, "CPI")
+    invoiced_pivot, invoiced_salesperson = reports["invoiced"]
+    not_invoiced_pivot, not_invoiced_salesperson = reports["not_invoiced"]
+    won_pivot, won_salesperson = reports["won"]
+
+    # Every row is either invoiced or not, so the two group sums add up to the total
+    cpi_by_invoiced = df.groupby("Invoiced")["CPI"].sum()
+    total_cpi = cpi_by_invoiced.sum()
+    # nunique skips rows without a MonthYear label
+    month_counts = df["MonthYear"].nunique()
+    avg_cpi = total_cpi / month_counts if month_counts else 0
+
+    # All rows are collected first so the frame is built once
+    summary_rows = [
+        {"Metrik": "Toplam CPI", "Değer": total_cpi},
+        {"Metrik": "Faturalanan CPI", "Değer": cpi_by_invoiced.get(True, 0.0)},
+        {"Metrik": "Faturalanmayan CPI", "Değer": cpi_by_invoiced.get(False, 0.0)},
+        {"Metrik": "Kazanılan CPI", "Değer": df["CPI"].where(won_mask).sum()},
+        {"Metrik": "Satış Elemanı Sayısı", "Değer": df["Sales Man"].nunique()},
+        {"Metrik": "Aylık Ortalama CPI", "Değer": avg_cpi},
+    ]
+    summary_metrics = pd.DataFrame(summary_rows)
 
     report_progress(3, total_steps, "Excel sayfaları hazırlanıyor...")
 
-    with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-        write_dataframe(writer, summary_metrics, "Özet Dashboard")
-        write_dataframe(
-            writer,
-            salesperson_summary,
-            "Özet Dashboard",
-            startrow=len(summary_metrics) + 3,
-        )
-
-        write_dataframe(writer, invoiced_pivot, "CPI Faturalanan Raporu")
-        write_dataframe(
-            writer,
-            invoiced_salesperson,
-            "CPI Faturalanan Raporu",
-            startrow=len(invoiced_pivot) + 3,
-        )
-
-        write_dataframe(writer, not_invoiced_pivot, "CPI Faturalanmayan Raporu")
-        write_dataframe(
-            writer,
-            not_invoiced_salesperson,
-            "CPI Faturalanmayan Raporu",
-            startrow=len(not_invoiced_pivot) + 3,
-        )
-
-        write_dataframe(writer, won_pivot, "CPI Kazanılan Raporu")
-        write_dataframe(
-            writer,
-            won_salesperson,
-            "CPI Kazanılan Raporu",
-            startrow=len(won_pivot) + 3,
-        )
-
-        write_dataframe(writer, df, "Detay Veri", index=False)
-
-    report_progress(4, total_steps, "Satır bazlı raporlar oluşturuluyor...")
-    workbook = load_workbook(output_file)
+    # Write-only workbook: rows stream to disk and charts go in before the
+    # single save, so the file is never loaded back
+    workbook = Workbook(write_only=True)
+    summary_sheet = workbook.create_sheet("Özet Dashboard")
+    write_dataframe(summary_sheet, summary_metrics)
+    write_dataframe(summary_sheet, salesperson_summary, gap_rows=2)
+    _add_summary_visuals(summary_sheet, len(summary_rows))
+
+    report_progress(4, total_steps, "Grafikler ekleniyor...")
+    for sheet_name, (pivot, salesperson) in (
+        ("CPI Faturalanan Raporu", (invoiced_pivot, invoiced_salesperson)),
+        ("CPI Faturalanmayan Raporu", (not_invoiced_pivot, not_invoiced_salesperson)),
+        ("CPI Kazanılan Raporu", (won_pivot, won_salesperson)),
+    ):
+        sheet = workbook.create_sheet(sheet_name)
+        write_dataframe(sheet, pivot)
+        write_dataframe(sheet, salesperson, gap_rows=2)
+        # Both tables with their headers and the two blank rows between them
+        _add_category_chart(sheet, len(pivot.columns), len(pivot) + len(salesperson) + 4)
+
+    write_dataframe(workbook.create_sheet("Detay Veri"), df)
+
+    report_progress(5, total_steps, "Satır bazlı raporlar oluşturuluyor...")
     _add_detail_sheets(workbook, df)
-    _add_summary_visuals(workbook, len(summary_metrics))
-
-    report_progress(5, total_steps, "Grafikler ekleniyor...")
-    _add_category_chart(
-        workbook, "CPI Faturalanan Raporu", len(invoiced_pivot.columns)
-    )
-    _add_category_chart(
-        workbook, "CPI Faturalanmayan Raporu", len(not_invoiced_pivot.columns)
-    )
-    _add_category_chart(workbook, "CPI Kazanılan Raporu", len(won_pivot.columns))
 
     workbook.save(output_file)
 
     report_progress(6, total_steps, "Rapor oluşturuldu.")
     report_progress(7, total_steps, f"Rapor kaydedildi: {output_file}")
-    print(f"Faturalanan kayıt sayısı: {len(invoiced_df)}")
-    print(f"Faturalanmayan kayıt sayısı: {len(not_invoiced_df)}")
-    print(f"QI Forecast = YES kayıt sayısı: {len(won_df)}")
+    print(f"Faturalanan kayıt sayısı: {int(invoiced_mask.sum())}")
+    print(f"Faturalanmayan kayıt sayısı: {int(not_invoiced_mask.sum())}")
+    print(f"QI Forecast = YES kayıt sayısı: {int(won_mask.sum())}")
 
 
-def _add_category_chart(workbook, sheet_name: str, column_count: int) -> None:
-    sheet = workbook[sheet_name]
+def _add_category_chart(sheet, column_count: int, max_row: int) -> None:
     if column_count <= 1:
         return
 
-    max_row = sheet.max_row
     max_col = column_count
 
     data = Reference(sheet, min_col=2, min_row=1, max_col=max_col, max_row=max_row)
     categories = Reference(sheet, min_col=1, min_row=2, max_row=max_row)
 
     chart_type = "line" if column_count <= 3 else "bar"
-    title = sheet_name.replace("Raporu", "Grafiği")
+    title = sheet.title.replace("Raporu", "Grafiği")
     add_chart(sheet, data, categories, chart_type=chart_type, title=title)
 
 
@@ -701,8 +902,12 @@ def parse_arguments(args: Optional[Iterable[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "input_file",
         nargs="?",
-        default="sales_data_master.xlsx",
-        help="Kaynak Excel dosyası",
+        default=(
+            "sales_data_master.parquet"
+            if os.path.exists("sales_data_master.parquet")
+            else "sales_data_master.xlsx"
+        ),
+        help="Kaynak veri dosyası (.xlsx veya .parquet)",
     )
     parser.add_argument(
         "output_file",
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("tkcalendar")
+
+import data_entry  # noqa: E402
+
+
+def _app_with(df: pd.DataFrame) -> data_entry.SalesEntryApp:
+    # The record helpers only touch self.df, so skip building the Tk window
+    app = object.__new__(data_entry.SalesEntryApp)
+    app.df = df
+    return app
+
+
+def test_append_record_into_text_dated_master():
+    # A legacy master keeps dd.mm.YYYY text, which pandas reads as a str column
+    master = pd.DataFrame({column: pd.Series(["x"], dtype="str") for column in data_entry.COLUMNS})
+    master["Date of Issue"] = pd.Series(["05.02.2024"], dtype="str")
+    master["Amount"] = [100.0]
+    record = pd.Series({column: "y" for column in data_entry.COLUMNS}, dtype=object)
+    record["Date of Issue"] = datetime(2024, 2, 1)
+    record["Date of Delivery"] = ""
+    record["Amount"] = 250.0
+    app = _app_with(master)
+
+    app._append_record(record)
+
+    assert len(app.df) == 2
+    assert app.df.loc[0, "Date of Issue"] == "05.02.2024"
+    assert app.df.loc[1, "Date of Issue"] == datetime(2024, 2, 1)
+    assert pd.isna(app.df.loc[1, "Date of Delivery"])
+    assert app.df.loc[1, "Amount"] == 250.0
+    assert app.df["Amount"].dtype == "float64"
+
+
+def test_prepare_for_parquet_keeps_dates_with_blanks():
+    df = pd.DataFrame({"Date of Delivery": pd.Series([datetime(2024, 2, 5), "", None], dtype=object)})
+
+    prepared = data_entry._prepare_for_parquet(df)
+
+    assert pd.api.types.is_datetime64_any_dtype(prepared["Date of Delivery"])
+    assert prepared["Date of Delivery"].iloc[0] == pd.Timestamp(2024, 2, 5)
+    assert prepared["Date of Delivery"].iloc[1:].isna().all()
+
+
+def test_issue_dates_parse_text_day_first():
+    dates = pd.Series(
+        [datetime(2024, 2, 5), "05.02.2024", "13.02.2024", "2024-02-05", "2024-02-05 00:00:00", "", None],
+        dtype=object,
+    )
+    app = _app_with(pd.DataFrame({"Date of Issue": dates}))
+    app._issue_dates = None
+
+    parsed = app._get_issue_dates()
+
+    expected = [pd.Timestamp(2024, 2, 5), pd.Timestamp(2024, 2, 5), pd.Timestamp(2024, 2, 13)]
+    expected += [pd.Timestamp(2024, 2, 5), pd.Timestamp(2024, 2, 5)]
+    assert parsed.iloc[:5].tolist() == expected
+    assert parsed.iloc[5:].isna().all()